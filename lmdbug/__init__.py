@@ -4,9 +4,11 @@ Lmdbug - LMDB Data Preview Tool
 Provides preview functionality for LMDB format data, supporting parsing and visualization of Protobuf serialized data.
 """
 
-from .core.lmdb_reader import LMDBReader
-from .core.data_service import DataService
-from .ui.gradio_interface import LmdbugInterface
+import importlib
+
+# Configure lmdbug's log sink at import time, as the eager exports did,
+# rather than on first access to a lazy export
+from .core import logging as _logging  # noqa: F401
 
 __version__ = "0.1.0"
 __author__ = "Lmdbug Project"
@@ -16,3 +18,24 @@ __all__ = [
     "DataService",
     "LmdbugInterface",
 ]
+
+# Public names are imported on first access so that importing the package
+# (e.g. for processor files) does not pull in gradio and lmdb.
+_LAZY_IMPORTS = {
+    "LMDBReader": (".core.lmdb_reader", "LMDBReader"),
+    "DataService": (".core.data_service", "DataService"),
+    "LmdbugInterface": (".ui.gradio_interface", "LmdbugInterface"),
+}
+
+
+def __getattr__(name: str):
+    if name in _LAZY_IMPORTS:
+        module_name, attr = _LAZY_IMPORTS[name]
+        value = getattr(importlib.import_module(module_name, __name__), attr)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
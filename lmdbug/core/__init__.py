@@ -5,8 +5,8 @@ This module provides the core components for reading LMDB databases
 and handling protobuf data serialization/deserialization.
 """
 
-from .lmdb_reader import LMDBReader
-from .data_service import DataService
+import importlib
+
 from .exceptions import LmdbugError, DatabaseError, ProtobufError, DataProcessingError
 from .config import LmdbugConfig, config
 
@@ -20,3 +20,23 @@ __all__ = [
     "LmdbugConfig",
     "config",
 ]
+
+# The reader and service are imported on first access so that importing a
+# light submodule (e.g. processor_registry) does not pull in lmdb and protobuf.
+_LAZY_IMPORTS = {
+    "LMDBReader": (".lmdb_reader", "LMDBReader"),
+    "DataService": (".data_service", "DataService"),
+}
+
+
+def __getattr__(name: str):
+    if name in _LAZY_IMPORTS:
+        module_name, attr = _LAZY_IMPORTS[name]
+        value = getattr(importlib.import_module(module_name, __name__), attr)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -6,12 +6,19 @@ This module provides centralized configuration handling for the application.
 
 from pathlib import Path
 from dataclasses import dataclass, field
+from functools import lru_cache
 
 from .logging import get_logger
 
 logger = get_logger()
 
 
+@lru_cache(maxsize=64)
+def _path_exists(path: str) -> bool:
+    """Cached existence check used by the validation warnings."""
+    return Path(path).exists()
+
+
 @dataclass
 class LmdbugConfig:
     """Central configuration for Lmdbug application."""
@@ -47,7 +54,7 @@ class LmdbugConfig:
 
     def validate_db_path(self) -> None:
         """Validate database path if provided."""
-        if self.db_path and not Path(self.db_path).exists():
+        if self.db_path and not _path_exists(self.db_path):
             logger.warning(f"Database path does not exist: {self.db_path}")
 
     def validate_protobuf_config(self) -> None:
@@ -57,7 +64,7 @@ class LmdbugConfig:
                 "protobuf_message_class is required when protobuf_module_path is provided"
             )
 
-        if self.protobuf_module_path and not Path(self.protobuf_module_path).exists():
+        if self.protobuf_module_path and not _path_exists(self.protobuf_module_path):
             logger.warning(
                 f"Protobuf module does not exist: {self.protobuf_module_path}"
             )
@@ -86,7 +93,7 @@ class LmdbugConfig:
                     setattr(self, key, value)
                 else:
                     setattr(self, key, value)
-                logger.debug(f"Updated config: {key}={value}")
+                logger.debug("Updated config: {}={}", key, value)
 
 
 # Global configuration instance
@@ -3,15 +3,27 @@ Simplified data service that combines LMDB reading and protobuf handling.
 """
 
 import importlib.util
+import os
+import threading
+from collections.abc import Iterator
+from contextlib import closing
+from itertools import islice
 from pathlib import Path
+from types import ModuleType
 from google.protobuf.json_format import MessageToDict
 
 from .lmdb_reader import LMDBReader
 from .logging import get_logger
+from .processor_registry import BaseFieldProcessor, processor_registry
 from .exceptions import ProtobufError, DataProcessingError
 
 logger = get_logger()
 
+# Executed protobuf modules by resolved path, with the file mtime they were
+# loaded at; shared across DataService instances so reloading a database
+# does not re-exec an unchanged module
+_proto_module_cache: dict[str, tuple[int, ModuleType]] = {}
+
 
 class DataService:
     """Simplified service for LMDB data preview with optional protobuf support."""
@@ -24,6 +36,8 @@ class DataService:
     ):
         self.lmdb_reader = LMDBReader(db_path, map_size)
         self.protobuf_message_class = None
+        self._message_local = threading.local()
+        self._processor_cache: dict[str, BaseFieldProcessor] = {}
         self.temp_files = []
         self.processor_paths = processor_paths
 
@@ -55,13 +69,22 @@ class DataService:
             raise ProtobufError(f"Proto module not found: {module_path}")
 
         try:
-            module_name = f"proto_module_{module_path_obj.stem}"
-            spec = importlib.util.spec_from_file_location(module_name, module_path)
-            if not spec or not spec.loader:
-                raise ProtobufError(f"Failed to create module spec for: {module_path}")
+            resolved_path = str(module_path_obj.resolve())
+            mtime = module_path_obj.stat().st_mtime_ns
+            cached = _proto_module_cache.get(resolved_path)
+            proto_module = cached[1] if cached and cached[0] == mtime else None
+
+            if proto_module is None:
+                module_name = f"proto_module_{module_path_obj.stem}"
+                spec = importlib.util.spec_from_file_location(module_name, module_path)
+                if not spec or not spec.loader:
+                    raise ProtobufError(
+                        f"Failed to create module spec for: {module_path}"
+                    )
 
-            proto_module = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(proto_module)
+                proto_module = importlib.util.module_from_spec(spec)
+                spec.loader.exec_module(proto_module)
+                _proto_module_cache[resolved_path] = (mtime, proto_module)
 
             if not hasattr(proto_module, message_class_name):
                 raise ProtobufError(
@@ -76,96 +99,151 @@ class DataService:
         except Exception as e:
             raise ProtobufError(f"Failed to load proto module: {e}") from e
 
+    @property
+    def has_protobuf(self) -> bool:
+        """Check if a protobuf message class is loaded."""
+        return self.protobuf_message_class is not None
+
     def get_database_info(self) -> dict:
         """Get database information."""
         info = self.lmdb_reader.get_basic_info()
         info["database_path"] = str(self.lmdb_reader.db_path)
-        info["has_protobuf"] = self.protobuf_message_class is not None
+        info["has_protobuf"] = self.has_protobuf
         return info
 
     def get_first_entries(self, count: int = 10) -> list[dict]:
         """Get the first N entries from the database."""
-        logger.debug(f"Retrieving first {count} entries from database")
-        entries = self.lmdb_reader.get_first_entries(count)
-        logger.debug(f"Retrieved {len(entries)} entries")
-        return [self._format_entry(k, v) for k, v in entries]
+        logger.debug("Retrieving first {} entries from database", count)
+        with closing(self.iter_entries()) as entries:
+            results = list(islice(entries, count))
+        logger.debug("Retrieved {} entries", len(results))
+        return results
+
+    def iter_entries(self) -> Iterator[dict]:
+        """Yield formatted entries in key order, one at a time.
+
+        The read transaction stays open until the iterator is exhausted or
+        closed.
+        """
+        with closing(self.lmdb_reader.iter_entries()) as entries:
+            for key, value in entries:
+                yield self._format_entry(key, value)
 
     def get_random_entries(self, count: int = 10) -> list[dict]:
         """Get the random N entries from the database."""
-        logger.debug(f"Retrieving random {count} entries from database")
-        entries = self.lmdb_reader.get_random_entries_keyhash(count)
-        logger.debug(f"Retrieved {len(entries)} entries")
+        logger.debug("Retrieving random {} entries from database", count)
+        entries = self.lmdb_reader.get_random_entries(count)
+        logger.debug("Retrieved {} entries", len(entries))
         return [self._format_entry(k, v) for k, v in entries]
 
     def search_keys(self, pattern: str, count: int = 10) -> list[dict]:
         """Search keys matching regex pattern and return first count matches."""
-        logger.debug(f"Searching for pattern '{pattern}', limit {count}")
-        matches = self.lmdb_reader.search_keys(pattern, count)
-        if not matches:
-            logger.debug(f"No matches found for pattern: {pattern}")
+        logger.debug("Searching for pattern '{}', limit {}", pattern, count)
+        with closing(self.iter_search_keys(pattern)) as matches:
+            results = list(islice(matches, count))
+        if not results:
+            logger.debug("No matches found for pattern: {}", pattern)
             return []
-        logger.debug(f"Found {len(matches)} matches for pattern: {pattern}")
-        return [self._format_entry(k, v) for k, v in matches]
+        logger.debug("Found {} matches for pattern: {}", len(results), pattern)
+        return results
+
+    def iter_search_keys(self, pattern: str) -> Iterator[dict]:
+        """Yield formatted entries whose keys match regex pattern.
+
+        The read transaction stays open until the iterator is exhausted or
+        closed.
+        """
+        with closing(self.lmdb_reader.iter_search_keys(pattern)) as matches:
+            for key, value in matches:
+                yield self._format_entry(key, value)
 
     def _format_entry(self, key_bytes: bytes, value_bytes: bytes) -> dict:
         """Format an entry for display, focusing on key and protobuf content."""
-        try:
-            key_str = key_bytes.decode("utf-8")
-        except UnicodeDecodeError:
-            key_str = key_bytes.hex()
+        # Most keys are plain ASCII, which decodes without UTF-8 validation
+        if key_bytes.isascii():
+            key_str = key_bytes.decode("ascii")
+        else:
+            try:
+                key_str = key_bytes.decode("utf-8")
+            except UnicodeDecodeError:
+                key_str = key_bytes.hex()
 
-        result = {"key": key_str}
+        result = {"key": key_str, "value_size": len(value_bytes)}
 
         # Try protobuf deserialization if available
         if self.protobuf_message_class:
             try:
-                message = self.protobuf_message_class()
+                message = self._get_message()
                 message.ParseFromString(value_bytes)
                 protobuf_data = MessageToDict(message, preserving_proto_field_name=True)
                 result["protobuf"] = protobuf_data
 
-                # Add media previews using registered processors
-                self._add_media_preview(result, protobuf_data)
+                # Add media previews using registered processors, skipping
+                # empty messages that have no fields to process
+                if protobuf_data:
+                    self._add_media_preview(result, protobuf_data)
 
             except Exception as e:
                 result["protobuf_error"] = f"Failed to deserialize: {str(e)}"
 
         return result
 
+    def _get_message(self):
+        """Return a reusable message instance for the current thread.
+
+        ParseFromString clears the message first, and MessageToDict copies
+        out every field, so one instance can be reused across entries.
+        """
+        message = getattr(self._message_local, "message", None)
+        if type(message) is not self.protobuf_message_class:
+            message = self.protobuf_message_class()
+            self._message_local.message = message
+        return message
+
     def _add_media_preview(self, result: dict, protobuf_dict: dict):
         """Add media previews using registered processors."""
-        from .processor_registry import processor_registry
-
         # Auto-load processors if none registered
-        if not processor_registry.list_processors():
+        if len(processor_registry) == 0:
             self._auto_load_processors()
 
         media_previews = {"text": [], "audio": [], "image": []}
         valid_types = set(media_previews.keys())
 
+        # Bind per-field lookups to locals once, since messages can have
+        # hundreds of fields
+        text_append = media_previews["text"].append
+        audio_append = media_previews["audio"].append
+        image_append = media_previews["image"].append
+        temp_files_append = self.temp_files.append
+        process_field = self._process_field
+
         for field_name, value in protobuf_dict.items():
             # Process field using registered processors
-            preview = self._process_field(field_name, value, processor_registry)
-            if preview:
+            preview = process_field(field_name, value, processor_registry)
+            if not preview:
+                continue
+
+            preview_type = preview.get("type")
+            if preview_type == "text":
+                text_append(preview)
+            elif preview_type == "audio":
+                audio_append(preview)
+            elif preview_type == "image":
+                image_append(preview)
+            elif "type" not in preview:
                 # Validate preview has required type field
-                if "type" not in preview:
-                    raise DataProcessingError(
-                        f"Preview for field '{field_name}' missing required 'type' field"
-                    )
-
-                preview_type = preview["type"]
-                # Validate preview type
-                if preview_type not in valid_types:
-                    raise DataProcessingError(
-                        f"Invalid preview type '{preview_type}' for field '{field_name}'. Valid types: {valid_types}"
-                    )
-
-                # Register temp file for cleanup if present
-                if "temp_path" in preview:
-                    self.temp_files.append(preview["temp_path"])
+                raise DataProcessingError(
+                    f"Preview for field '{field_name}' missing required 'type' field"
+                )
+            else:
+                raise DataProcessingError(
+                    f"Invalid preview type '{preview_type}' for field '{field_name}'. Valid types: {valid_types}"
+                )
 
-                if preview_type in media_previews:
-                    media_previews[preview_type].append(preview)
+            # Register temp file for cleanup if present
+            temp_path = preview.get("temp_path")
+            if temp_path is not None:
+                temp_files_append(temp_path)
 
         # Only add non-empty previews
         filtered_previews = {k: v for k, v in media_previews.items() if v}
@@ -175,24 +253,31 @@ class DataService:
     def _process_field(self, field_name: str, value, processor_registry) -> dict | None:
         """Process a field using registered processors."""
 
-        # Try to find a processor registered with the exact field name
-        if field_name in processor_registry.list_processors():
+        # Look up a processor registered with the exact field name
+        processor_class = processor_registry.get_processor_class(field_name)
+        if processor_class is not None:
             try:
-                processor_instance = processor_registry.create_processor(field_name)
+                # Reuse one instance per field, unless the registry now maps
+                # the field to a different class (e.g. after a reload)
+                processor_instance = self._processor_cache.get(field_name)
+                if type(processor_instance) is not processor_class:
+                    processor_instance = processor_class(None)
+                    self._processor_cache[field_name] = processor_instance
                 result = processor_instance.process(field_name, value)
                 if result:
                     return result
             except Exception as e:
-                logger.debug(f"Processor {field_name} failed for {field_name}: {e}")
+                logger.debug(
+                    "Processor {} failed for {}: {}", field_name, field_name, e
+                )
 
         return None
 
     def _auto_load_processors(self, clear_existing: bool = False):
         """Auto-load processors from configured paths."""
-        from .processor_registry import processor_registry
-
         if clear_existing:
             processor_registry.clear()
+            self._processor_cache.clear()
 
         if not self.processor_paths:
             return
@@ -225,7 +310,9 @@ class DataService:
         """Clean up temporary files."""
         for path in self.temp_files:
             try:
-                Path(path).unlink(missing_ok=True)
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
             except Exception as e:
-                logger.debug(f"Failed to cleanup {path}: {e}")
+                logger.debug("Failed to cleanup {}: {}", path, e)
         self.temp_files.clear()
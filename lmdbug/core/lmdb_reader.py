@@ -1,6 +1,10 @@
 import re
 import lmdb
+import random
 import hashlib
+from collections.abc import Callable, Iterator
+from contextlib import closing
+from functools import lru_cache
 from pathlib import Path
 from itertools import islice
 
@@ -9,19 +13,169 @@ from .exceptions import DatabaseError
 
 logger = get_logger()
 
+_REGEX_METACHARS = frozenset(".^$*+?{}[]\\|()")
+_OPTIONAL_QUANTIFIERS = frozenset("*?{")
+# Letters that also case-fold to non-ASCII characters under re.IGNORECASE
+# (e.g. "k" and the Kelvin sign), so they cannot bound a byte range
+_NON_ASCII_FOLDS = frozenset("iksIKS")
+
+
+def _literal_prefix(pattern: str) -> tuple[bytes, bytes] | None:
+    """Extract the key range implied by a ``^``-anchored literal prefix.
+
+    Returns (lower, upper) byte bounds such that every key matching the
+    pattern case-insensitively starts with something between them, or
+    None if the pattern has no usable anchored prefix.
+    """
+    if not pattern.startswith("^") or "|" in pattern:
+        return None
+
+    literal = []
+    for char in pattern[1:]:
+        if char in _REGEX_METACHARS:
+            # A trailing *, ? or {m,n} may make the previous char optional
+            if char in _OPTIONAL_QUANTIFIERS and literal:
+                literal.pop()
+            break
+        if not char.isascii() or char in _NON_ASCII_FOLDS:
+            break
+        literal.append(char)
+
+    if not literal:
+        return None
+
+    prefix = "".join(literal)
+    # ASCII uppercase sorts before lowercase, so every case variant of the
+    # prefix lies between its all-upper and all-lower forms
+    return prefix.upper().encode("ascii"), prefix.lower().encode("ascii")
+
+
+def _has_whitespace_escape(pattern: str) -> bool:
+    """Check whether a regex pattern uses a ``\\s`` or ``\\S`` escape.
+
+    In str patterns these treat the ASCII separators \\x1c-\\x1f as
+    whitespace, while in bytes patterns they do not.
+    """
+    escaped = False
+    for char in pattern:
+        if escaped:
+            if char in "sS":
+                return True
+            escaped = False
+        elif char == "\\":
+            escaped = True
+    return False
+
+
+def _compile_pattern(
+    pattern: str,
+) -> tuple[re.Pattern[str], re.Pattern[bytes] | None, re.Pattern[bytes] | None]:
+    """Compile the regexes used to match keys against a search pattern.
+
+    Returns:
+        (regex, bytes_regex, literal_regex): the case-insensitive str
+        regex, its bytes equivalent for ASCII patterns, and a
+        case-sensitive bytes regex to run over lowercased keys when the
+        pattern is a plain substring or alternation of substrings. The
+        last two are None when not applicable.
+
+    Raises:
+        re.error: If the pattern is not a valid regex.
+    """
+    regex = re.compile(pattern, re.IGNORECASE)
+
+    # An ASCII pattern matches ASCII keys identically when compiled over
+    # bytes, which avoids decoding every key to str. The exception is
+    # \s/\S: str patterns count \x1c-\x1f as whitespace and bytes patterns
+    # do not, so patterns using them stay on the str path
+    bytes_regex = None
+    if pattern.isascii() and not _has_whitespace_escape(pattern):
+        try:
+            bytes_regex = re.compile(pattern.encode("ascii"), re.IGNORECASE)
+        except re.error:
+            bytes_regex = None
+
+    # "foo" or "foo|bar|baz" with no other metacharacters is a plain
+    # substring search. Matching the lowercased key case-sensitively lets
+    # the regex engine use its literal search, which IGNORECASE disables
+    # (measured faster than both the IGNORECASE regex and `in`)
+    literal_regex = None
+    if bytes_regex is not None:
+        terms = pattern.split("|")
+        if not any(_REGEX_METACHARS.intersection(term) for term in terms):
+            literal_regex = re.compile(pattern.lower().encode("ascii"))
+
+    return regex, bytes_regex, literal_regex
+
+
+@lru_cache(maxsize=64)
+def _compile_matcher(
+    pattern: str,
+) -> tuple[Callable[[bytes], bool], tuple[bytes, bytes] | None]:
+    """Build the key matcher and seek range for a regex search pattern.
+
+    Cached so that repeated searches for the same pattern (e.g. a UI
+    refreshing results) skip recompiling and re-analysing it.
+
+    Returns:
+        (matches_pattern, key_range): a predicate over raw keys, and the
+        (lower, upper) bounds from _literal_prefix or None.
+
+    Raises:
+        re.error: If the pattern is not a valid regex.
+    """
+    regex, bytes_regex, literal_regex = _compile_pattern(pattern)
+
+    # Pick the matcher once so the per-key call does no dispatching.
+    # Invalid UTF-8 decodes to U+FFFD rather than being dropped, so a full
+    # scan agrees with the anchored-prefix seek on such keys
+    str_search = regex.search
+    if bytes_regex is None:
+
+        def matches_pattern(key: bytes) -> bool:
+            return str_search(key.decode("utf-8", errors="replace")) is not None
+
+    elif literal_regex is not None:
+        literal_search = literal_regex.search
+
+        def matches_pattern(key: bytes) -> bool:
+            if key.isascii():
+                return literal_search(key.lower()) is not None
+            return str_search(key.decode("utf-8", errors="replace")) is not None
+
+    else:
+        bytes_search = bytes_regex.search
+
+        def matches_pattern(key: bytes) -> bool:
+            if key.isascii():
+                return bytes_search(key) is not None
+            return str_search(key.decode("utf-8", errors="replace")) is not None
+
+    return matches_pattern, _literal_prefix(pattern)
+
 
 class LMDBReader:
     """Simple LMDB database reader for data preview and key search."""
 
-    def __init__(self, db_path: str, map_size: int = 10 * 1024 * 1024 * 1024):
+    def __init__(
+        self,
+        db_path: str,
+        map_size: int = 10 * 1024 * 1024 * 1024,
+        readahead: bool = True,
+    ):
         """Initialize LMDB reader.
 
         Args:
             db_path: Path to the LMDB database
             map_size: Maximum size of the database in bytes (default: 10GB)
+            readahead: Enable OS readahead on the memory map. On by default
+                since key search and random sampling walk the cursor
+                sequentially; disable it to limit resident memory when only
+                reading a few entries from a database larger than RAM.
         """
         self.db_path = Path(db_path)
         self.map_size = map_size
+        self.readahead = readahead
         self.env = None
         self._validate_path()
 
@@ -44,10 +198,18 @@ class LMDBReader:
         """Open the LMDB environment."""
         try:
             self.env = lmdb.open(
-                str(self.db_path), readonly=True, lock=False, map_size=self.map_size
+                str(self.db_path),
+                readonly=True,
+                lock=False,
+                readahead=self.readahead,
+                map_size=self.map_size,
             )
             logger.info(f"Successfully opened LMDB database: {self.db_path}")
-            logger.debug(f"LMDB database map_size: {self.map_size}")
+            logger.debug(
+                "LMDB database map_size: {}, readahead: {}",
+                self.map_size,
+                self.readahead,
+            )
         except Exception as e:
             error_msg = f"Failed to open LMDB database at {self.db_path}: {e}"
             logger.error(error_msg)
@@ -92,40 +254,105 @@ class LMDBReader:
 
     def search_keys(self, pattern: str, count: int = 10) -> list[tuple[bytes, bytes]]:
         """Search keys matching regex pattern and return first count matches."""
+        with closing(self.iter_search_keys(pattern)) as matches:
+            return list(islice(matches, count))
+
+    def iter_search_keys(self, pattern: str) -> Iterator[tuple[bytes, bytes]]:
+        """Yield entries whose keys match regex pattern, in key order.
+
+        The read transaction stays open until the iterator is exhausted or
+        closed.
+        """
         self._ensure_open()
 
-        # Try to compile as regex pattern
+        # Try to compile as regex pattern, falling back to a substring match
         try:
-            regex = re.compile(pattern, re.IGNORECASE)
-            use_regex = True
+            matches_pattern, key_range = _compile_matcher(pattern)
         except re.error as e:
-            logger.warning(f"Invalid regex pattern '{pattern}': {e}")
+            logger.warning("Invalid regex pattern '{}': {}", pattern, e)
             pattern_bytes = pattern.encode("utf-8")
-            use_regex = False
+            key_range = None
 
-        def matches_pattern(key: bytes) -> bool:
-            if use_regex:
-                return bool(regex.search(key.decode("utf-8", errors="ignore")))
-            else:
+            def matches_pattern(key: bytes) -> bool:
                 return pattern_bytes in key
 
         with self.env.begin() as txn:
             cursor = txn.cursor()
-            cursor.first()
+            upper = None
+            if key_range:
+                # Seek straight to the anchored prefix instead of scanning
+                # from the first key, and stop once keys sort past it
+                lower, upper = key_range
+                upper_len = len(upper)
+                if not cursor.set_range(lower):
+                    return
+            else:
+                cursor.first()
 
-            # Use generator + islice for efficient matching
-            matching_entries = (
-                (key, value) for key, value in cursor if matches_pattern(key)
-            )
-            return list(islice(matching_entries, count))
+            # Walk keys only; values are read from the cursor for matches
+            for key in cursor.iternext(keys=True, values=False):
+                if upper is not None and key[:upper_len] > upper:
+                    break
+                if matches_pattern(key):
+                    yield key, cursor.value()
 
     def get_first_entries(self, count: int = 10) -> list[tuple[bytes, bytes]]:
         """Get the first N entries from the database."""
+        with closing(self.iter_entries()) as entries:
+            return list(islice(entries, count))
+
+    def iter_entries(self) -> Iterator[tuple[bytes, bytes]]:
+        """Yield all entries in key order.
+
+        The read transaction stays open until the iterator is exhausted or
+        closed.
+        """
         self._ensure_open()
         with self.env.begin() as txn:
             cursor = txn.cursor()
             cursor.first()
-            return list(islice(cursor, count))
+            yield from cursor
+
+    def get_random_entries(self, count: int = 10) -> list[tuple[bytes, bytes]]:
+        """Get `count` entries sampled uniformly at random, in key order.
+
+        Returns every entry if the database holds fewer than `count`.
+        Random positions are drawn from the entry count and the cursor
+        skips between them, so no per-entry hashing is needed and a new
+        sample is drawn on each call.
+        """
+        self._ensure_open()
+        results: list[tuple[bytes, bytes]] = []
+
+        with self.env.begin() as txn:
+            total = txn.stat()["entries"]
+
+            if total == 0:
+                logger.error(
+                    "LMDB database is empty: cannot sample random entries (count={})",
+                    count,
+                )
+                return results
+
+            positions = sorted(random.sample(range(total), min(count, total)))
+
+            cursor = txn.cursor()
+            cursor.first()
+            keys = cursor.iternext(keys=True, values=False)
+
+            previous = -1
+            for position in positions:
+                # Consume the keys in between without a Python-level loop
+                skip = position - previous - 1
+                if skip:
+                    next(islice(keys, skip, skip), None)
+                key = next(keys, None)
+                if key is None:
+                    break
+                results.append((key, cursor.value()))
+                previous = position
+
+        return results
 
     def get_random_entries_keyhash(
         self,
@@ -147,7 +374,7 @@ class LMDBReader:
             if total == 0:
                 logger.error(
                     "LMDB database is empty: cannot sample random entries "
-                    "(count=%d, oversample_factor=%s)",
+                    "(count={}, oversample_factor={})",
                     count,
                     oversample_factor,
                 )
@@ -161,19 +388,28 @@ class LMDBReader:
             cursor = txn.cursor()
             cursor.first()
 
-            for key, value in cursor:
-                h = int.from_bytes(
-                    hashlib.blake2b(key, digest_size=8).digest(),
-                    "big",
-                )
+            if count <= 0:
+                return results
+
+            # Bind the hash function to a local for the per-key loop
+            blake2b = hashlib.blake2b
+            from_bytes = int.from_bytes
+            append = results.append
+            found = 0
+
+            # Walk keys only; values are read from the cursor for sampled keys.
+            # The count check only runs on hits, which are rare
+            for key in cursor.iternext(keys=True, values=False):
+                h = from_bytes(blake2b(key, digest_size=8).digest(), "big")
                 if h < threshold:
-                    results.append((key, value))
-                if len(results) >= count:
-                    return results
+                    append((key, cursor.value()))
+                    found += 1
+                    if found >= count:
+                        return results
 
         logger.warning(
             "Key-hash sampling returned fewer entries than requested "
-            "(got=%d, expected=%d, total=%d, oversample_factor=%.2f)",
+            "(got={}, expected={}, total={}, oversample_factor={:.2f})",
             len(results),
             count,
             total,
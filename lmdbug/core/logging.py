@@ -2,25 +2,41 @@ import sys
 from pathlib import Path
 from loguru import logger
 
-logger.remove()
+# Ids of the sinks added by this module, so setup() can replace them
+# without removing sinks added by the host application. Checked before
+# assigning so that reloading this module keeps the existing sinks.
+if "_handler_ids" not in globals():
+    _handler_ids: list[int] = []
 
-logger.add(
-    sys.stderr,
-    level="INFO",
-    format=(
-        "<green>{time:HH:mm:ss}</green> | "
-        "<level>{level: <8}</level> | "
-        "<cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - "
-        "<level>{message}</level>"
-    ),
-    colorize=True,
-    backtrace=True,
-    diagnose=True,
-)
+    # Replace only loguru's default stderr sink (id 0); the host
+    # application may already have removed it or added its own sinks
+    try:
+        logger.remove(0)
+    except ValueError:
+        pass
+
+    _handler_ids.append(
+        logger.add(
+            sys.stderr,
+            level="INFO",
+            format=(
+                "<green>{time:HH:mm:ss}</green> | "
+                "<level>{level: <8}</level> | "
+                "<cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - "
+                "<level>{message}</level>"
+            ),
+            colorize=True,
+            backtrace=False,
+            diagnose=False,
+        )
+    )
 
 
 def setup(
-    level: str = "INFO", file: str | Path | None = None, colorize: bool | None = None
+    level: str = "INFO",
+    file: str | Path | None = None,
+    colorize: bool | None = None,
+    multiprocess: bool = False,
 ):
     """Setup logging configuration.
 
@@ -28,12 +44,20 @@ def setup(
         level: Log level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         file: Optional log file path
         colorize: Enable colors (auto-detects if None)
+        multiprocess: Route file records through a queue so several
+            processes can share the log file
     """
-    logger.remove()
+    for handler_id in _handler_ids:
+        logger.remove(handler_id)
+    _handler_ids.clear()
 
     if colorize is None:
         colorize = sys.stderr.isatty()
 
+    # Extended and annotated tracebacks are slow and only useful while
+    # debugging
+    debug = level.upper() == "DEBUG"
+
     format_str = (
         (
             "<green>{time:HH:mm:ss}</green> | "
@@ -45,29 +69,34 @@ def setup(
         else ("{time:HH:mm:ss} | {level: <8} | {name}:{function}:{line} - {message}")
     )
 
-    logger.add(
-        sys.stderr,
-        level=level,
-        format=format_str,
-        colorize=colorize,
-        backtrace=True,
-        diagnose=True,
+    _handler_ids.append(
+        logger.add(
+            sys.stderr,
+            level=level,
+            format=format_str,
+            colorize=colorize,
+            backtrace=debug,
+            diagnose=debug,
+        )
     )
 
     if file:
         file_path = Path(file)
         file_path.parent.mkdir(parents=True, exist_ok=True)
 
-        logger.add(
-            str(file_path),
-            level=level,
-            format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name}:{function}:{line} - {message}",
-            rotation="10 MB",
-            retention="7 days",
-            compression="zip",
-            backtrace=True,
-            diagnose=True,
-            enqueue=True,
+        _handler_ids.append(
+            logger.add(
+                str(file_path),
+                level=level,
+                format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name}:{function}:{line} - {message}",
+                rotation="10 MB",
+                retention="7 days",
+                compression="zip",
+                backtrace=debug,
+                diagnose=debug,
+                enqueue=multiprocess,
+                delay=True,
+            )
         )
 
 
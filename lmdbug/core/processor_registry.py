@@ -7,6 +7,8 @@ custom field processors.
 
 import importlib.util
 from abc import ABC, abstractmethod
+from collections.abc import Iterable
+from typing import Any
 from pathlib import Path
 
 from .logging import get_logger
@@ -22,6 +24,9 @@ class BaseFieldProcessor(ABC):
     used to handle different data types in protobuf messages.
     """
 
+    # Shared by all processors; bound once at class level rather than per instance
+    logger = get_logger()
+
     def __init__(self, config: dict | None = None):
         """Initialize the processor.
 
@@ -29,7 +34,6 @@ class BaseFieldProcessor(ABC):
             config: Configuration dictionary for the processor.
         """
         self.config = config or {}
-        self.logger = get_logger()
 
     @abstractmethod
     def process(self, field_name: str, value) -> dict:
@@ -47,12 +51,32 @@ class BaseFieldProcessor(ABC):
         """
         pass
 
+    def process_many(self, items: list[tuple[str, Any]]) -> list[dict]:
+        """Process several protobuf field values in one call.
+
+        Subclasses can override this to share setup work across values,
+        e.g. reusing a header or buffer when many records have the same
+        format.
+
+        Args:
+            items: List of (field_name, value) pairs
+
+        Returns:
+            List of processing results, in the same order as ``items``.
+        """
+        return [self.process(field_name, value) for field_name, value in items]
+
 
 class ProcessorRegistry:
     """Registry for managing field processor implementations."""
 
     def __init__(self):
         self._processors: dict[str, type[BaseFieldProcessor]] = {}
+        # Processors registered by each loaded file, by resolved path with the
+        # file mtime, so reloading an unchanged file skips re-executing it
+        self._file_cache: dict[
+            str, tuple[int, dict[str, type[BaseFieldProcessor]]]
+        ] = {}
 
     def register(self, name: str, processor_class: type[BaseFieldProcessor]) -> None:
         """Register a processor implementation.
@@ -62,7 +86,19 @@ class ProcessorRegistry:
             processor_class: Processor class inheriting from BaseFieldProcessor.
         """
         self._processors[name] = processor_class
-        logger.debug(f"Registered processor: {name}")
+        logger.debug("Registered processor: {}", name)
+
+    def register_many(
+        self, processors: Iterable[tuple[str, type[BaseFieldProcessor]]]
+    ) -> None:
+        """Register several processor implementations in one pass.
+
+        Args:
+            processors: Iterable of (name, processor_class) pairs.
+        """
+        new_processors = dict(processors)
+        self._processors.update(new_processors)
+        logger.debug("Registered {} processors", len(new_processors))
 
     def register_decorator(self, name: str | list[str]):
         """Decorator for registering processor classes.
@@ -88,8 +124,7 @@ class ProcessorRegistry:
             if isinstance(name, str):
                 self.register(name, processor_class)
             elif isinstance(name, list):
-                for field_name in name:
-                    self.register(field_name, processor_class)
+                self.register_many((field_name, processor_class) for field_name in name)
             else:
                 raise ValueError("name must be a string or list of strings")
             return processor_class
@@ -127,6 +162,10 @@ class ProcessorRegistry:
         """Get list of registered processors."""
         return list(self._processors.keys())
 
+    def __len__(self) -> int:
+        """Get number of registered processors."""
+        return len(self._processors)
+
     def clear(self) -> None:
         """Clear all registered processors."""
         self._processors.clear()
@@ -145,7 +184,19 @@ class ProcessorRegistry:
         if not processor_path.exists():
             raise FileNotFoundError(f"Processor file not found: {processor_file_path}")
 
-        initial_count = len(self._processors)
+        resolved_path = str(processor_path.resolve())
+        mtime = processor_path.stat().st_mtime_ns
+        cached = self._file_cache.get(resolved_path)
+        if cached and cached[0] == mtime:
+            cached_processors = cached[1]
+            self.register_many(cached_processors.items())
+            logger.info(
+                f"Loaded {len(cached_processors)} cached processors from "
+                f"{processor_file_path}"
+            )
+            return len(cached_processors)
+
+        previous = dict(self._processors)
 
         # Load module
         spec = importlib.util.spec_from_file_location(
@@ -160,9 +211,15 @@ class ProcessorRegistry:
         module = importlib.util.module_from_spec(spec)
         spec.loader.exec_module(module)
 
-        loaded_count = len(self._processors) - initial_count
-        logger.info(f"Loaded {loaded_count} processors from {processor_file_path}")
-        return loaded_count
+        loaded = {
+            name: processor_class
+            for name, processor_class in self._processors.items()
+            if previous.get(name) is not processor_class
+        }
+        self._file_cache[resolved_path] = (mtime, loaded)
+
+        logger.info(f"Loaded {len(loaded)} processors from {processor_file_path}")
+        return len(loaded)
 
 
 # Global registry instance
@@ -6,7 +6,6 @@ Main entry point for the application.
 
 from pathlib import Path
 import typer
-from .ui.gradio_interface import LmdbugInterface
 from .core.logging import setup as setup_logging, get_logger
 from .core.config import config
 
@@ -50,6 +49,9 @@ def main(
         typer.echo("Lmdbug version 0.1.0")
         raise typer.Exit()
 
+    # Imported here so `--help` and `--version` do not load gradio
+    from .ui.gradio_interface import LmdbugInterface
+
     # Update configuration from command line arguments
     config.update_from_cli_args(
         db_path=db_path,
@@ -658,7 +658,7 @@ class LmdbugInterface:
             audio_fields = []
             text_preview = ""
             audio_preview = None
-            has_protobuf = service.get_database_info().get("has_protobuf", False)
+            has_protobuf = service.has_protobuf
 
             session_obj.results = results
 
@@ -727,7 +727,7 @@ class LmdbugInterface:
             audio_fields = []
             text_preview = ""
             audio_preview = None
-            has_protobuf = service.get_database_info().get("has_protobuf", False)
+            has_protobuf = service.has_protobuf
 
             session_obj.results = results
 
@@ -798,7 +798,7 @@ class LmdbugInterface:
             audio_fields = []
             text_preview = ""
             audio_preview = None
-            has_protobuf = service.get_database_info().get("has_protobuf", False)
+            has_protobuf = service.has_protobuf
 
             if results and has_protobuf:
                 first_entry = results[0]
@@ -973,8 +973,7 @@ class LmdbugInterface:
         if not service:
             has_protobuf = False
         else:
-            db_info = service.get_database_info()
-            has_protobuf = db_info.get("has_protobuf", False)
+            has_protobuf = service.has_protobuf
 
         if not has_protobuf:
             return (
@@ -1024,10 +1023,7 @@ class LmdbugInterface:
         if not service:
             return ""
 
-        db_info = service.get_database_info()
-        has_protobuf = db_info.get("has_protobuf", False)
-
-        if not has_protobuf:
+        if not service.has_protobuf:
             return ""
 
         entry = self._get_entry_by_key(results, selected_entry_key)
@@ -1054,10 +1050,7 @@ class LmdbugInterface:
         if not service:
             return None
 
-        db_info = service.get_database_info()
-        has_protobuf = db_info.get("has_protobuf", False)
-
-        if not has_protobuf:
+        if not service.has_protobuf:
             return None
 
         entry = self._get_entry_by_key(results, selected_entry_key)
@@ -1122,7 +1115,7 @@ class LmdbugInterface:
                         </div>
                     </div>
                 </div>
-            """.format(len(str(result).encode("utf-8")))
+            """.format(result.get("value_size", 0))
 
         html += """
             </div>